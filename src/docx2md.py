@@ -44,6 +44,7 @@ class Docx2MdConverter:
         }
 
         self.headings, self.heading_cnt = extract_headings_via_word_automation(path_input_file)
+        self.style_levels, self.default_style_id = {}, None
 
         if vlm is not None and torch.cuda.is_available() and HAS_IMG_DEPS:
             self.model, self.processor = self._get_vlm(vlm)
@@ -53,6 +54,7 @@ class Docx2MdConverter:
     def execute(self):
         doc = Document(self.path_input)
         md_lines = []
+        self.style_levels, self.default_style_id = self._build_style_index(doc)
 
         # 1) main text
         for block in doc._element.body.iterchildren():
@@ -139,7 +141,7 @@ class Docx2MdConverter:
         # 段落
         if tag == 'p':
             para = Paragraph(block, doc)
-            level = self._parse_heading_level(para.style.name)
+            level = self._lookup_heading_level(block)
             # Heading
             if level > 0:
                 text = para.text.strip()
@@ -149,15 +151,14 @@ class Docx2MdConverter:
                         md_lines.append(f"{'#' * level} {_heading}")
                         md_lines.append("")
                         self.heading_cnt += 1
-                    else:
-                        print('text', text)
-                        print('heading', _heading)
-                        print()
-                    return
-                else:
-                    md_lines.append(f"{'#' * level} {text}")
-                    md_lines.append("")
-                    return
+                        return
+                    print('text', text)
+                    print('heading', _heading)
+                    print()
+                # 未能与 Word 提取的标题对应时，仍按原文输出，避免丢失段落
+                md_lines.append(f"{'#' * level} {text}")
+                md_lines.append("")
+                return
 
             # 正文
             items = self._extract_paragraph_items(para, doc)
@@ -323,6 +324,63 @@ class Docx2MdConverter:
                 return int(num)
         return 0
 
+    def _build_style_index(self, doc):
+        """
+        解析 styles.xml，建立 styleId → 有效标题级别 的索引，每个文档只做一次。
+        优先使用 w:outlineLvl，其次样式名 (“heading 2”/“标题 2”)，否则沿 basedOn 继承。
+        返回 (索引, 默认段落样式 styleId)。
+        """
+        raw = {}
+        default_style_id = None
+        for style in doc.styles.element.findall('w:style', self.ns):
+            if style.get(qn('w:type')) != 'paragraph':
+                continue
+            style_id = style.get(qn('w:styleId'))
+            if style_id is None:
+                continue
+            if style.get(qn('w:default')) in ('1', 'true', 'on'):
+                default_style_id = style_id
+
+            own = None
+            outline = style.find('w:pPr/w:outlineLvl', self.ns)
+            if outline is not None and (outline.get(qn('w:val')) or '').isdigit():
+                # outlineLvl 0-8 对应 1-9 级标题，9 表示正文
+                lvl = int(outline.get(qn('w:val')))
+                own = lvl + 1 if lvl < 9 else 0
+            else:
+                name = style.find('w:name', self.ns)
+                if name is not None:
+                    own = self._parse_heading_level(name.get(qn('w:val'))) or None
+
+            based_on = style.find('w:basedOn', self.ns)
+            parent = based_on.get(qn('w:val')) if based_on is not None else None
+            raw[style_id] = (own, parent)
+
+        levels = {}
+
+        def resolve(style_id, seen):
+            if style_id in levels:
+                return levels[style_id]
+            if style_id not in raw or style_id in seen:
+                return 0
+            seen.add(style_id)
+            own, parent = raw[style_id]
+            level = own if own is not None else resolve(parent, seen)
+            levels[style_id] = level
+            return level
+
+        for style_id in raw:
+            resolve(style_id, set())
+        return levels, default_style_id
+
+    def _lookup_heading_level(self, block) -> int:
+        """
+        根据段落的 w:pStyle 在样式索引中查找标题级别；未指定样式或样式不存在时使用默认段落样式。
+        """
+        p_style = block.find('w:pPr/w:pStyle', self.ns)
+        style_id = p_style.get(qn('w:val')) if p_style is not None else self.default_style_id
+        return self.style_levels.get(style_id, self.style_levels.get(self.default_style_id, 0))
+
     def _extract_paragraph_items(self, para: Paragraph, doc) -> list:
         """
         对一个 Paragraph 的所有 run 做扫描，返回扁平化 items。
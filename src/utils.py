@@ -48,9 +48,10 @@ def extract_headings_via_word_automation(doc_path):
 
         # Iterate through all paragraphs in the document
         for para in doc.Paragraphs:
-            # Check if the paragraph's style is a heading
-            style_name = para.Style.NameLocal
-            if style_name.lower().startswith('标题'):
+            # Check if the paragraph's style is a heading. Select by the style's
+            # outline level so inherited / custom heading styles agree with the
+            # styles.xml index used by Docx2MdConverter (10 = wdOutlineLevelBodyText).
+            if para.Style.ParagraphFormat.OutlineLevel != 10:
                 # para.Range.ListFormat.ListString is the key property.
                 # It holds the rendered number/bullet string (e.g., "1.1", "A.", "i.").
                 # It is an empty string for non-list paragraphs.
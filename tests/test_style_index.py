@@ -0,0 +1,83 @@
+"""
+Reproducible check for the styles.xml heading index in Docx2MdConverter.
+
+Run from the repository root with:  python -m pytest -q tests
+"""
+from docx import Document
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls
+
+from src.docx2md import Docx2MdConverter
+
+
+def _add_style(doc, style_id, name, based_on=None, outline_lvl=None):
+    xml = f'<w:style {nsdecls("w")} w:type="paragraph" w:styleId="{style_id}">'
+    xml += f'<w:name w:val="{name}"/>'
+    if based_on is not None:
+        xml += f'<w:basedOn w:val="{based_on}"/>'
+    if outline_lvl is not None:
+        xml += f'<w:pPr><w:outlineLvl w:val="{outline_lvl}"/></w:pPr>'
+    xml += '</w:style>'
+    doc.styles.element.append(parse_xml(xml))
+
+
+def _build_docx(path):
+    doc = Document()
+    _add_style(doc, 'ChapterTitle', '章节标题', based_on='Heading1')
+    _add_style(doc, 'SubChapter', 'Sub Chapter', based_on='ChapterTitle', outline_lvl=2)
+    _add_style(doc, 'Localized2', '标题 2')
+    _add_style(doc, 'Outline4', 'Custom Outline', outline_lvl=3)
+    _add_style(doc, 'NotHeading', 'Not Heading', based_on='Heading1', outline_lvl=9)
+    _add_style(doc, 'CycleA', 'Cycle A', based_on='CycleB')
+    _add_style(doc, 'CycleB', 'Cycle B', based_on='CycleA')
+
+    for style_id in ('ChapterTitle', 'SubChapter', 'Localized2', 'Outline4',
+                     'NotHeading', 'CycleA', 'MissingStyle'):
+        p = doc.add_paragraph(style_id)
+        p._p.get_or_add_pPr().append(
+            parse_xml(f'<w:pStyle {nsdecls("w")} w:val="{style_id}"/>'))
+    doc.save(path)
+
+
+def test_style_index_levels(tmp_path):
+    path_docx = tmp_path / 'styles.docx'
+    _build_docx(str(path_docx))
+
+    converter = Docx2MdConverter(str(path_docx), str(tmp_path))
+    levels, default_style_id = converter._build_style_index(Document(str(path_docx)))
+
+    assert default_style_id == 'Normal'
+    assert levels['Heading1'] == 1
+    assert levels['ChapterTitle'] == 1   # basedOn inheritance
+    assert levels['SubChapter'] == 3     # own outlineLvl overrides parent
+    assert levels['Localized2'] == 2     # localized style name
+    assert levels['Outline4'] == 4       # outlineLvl without heading name
+    assert levels['NotHeading'] == 0     # outlineLvl 9 = body text
+    assert levels['CycleA'] == 0 and levels['CycleB'] == 0
+
+
+def test_execute_emits_headings(tmp_path):
+    path_docx = tmp_path / 'styles.docx'
+    _build_docx(str(path_docx))
+
+    lines = Docx2MdConverter(str(path_docx), str(tmp_path)).execute().splitlines()
+
+    assert '# ChapterTitle' in lines
+    assert '### SubChapter' in lines
+    assert '## Localized2' in lines
+    assert '#### Outline4' in lines
+    assert 'NotHeading' in lines
+    assert 'CycleA' in lines
+    assert 'MissingStyle' in lines       # unknown styleId falls back to Normal
+
+
+def test_process_block_before_execute(tmp_path):
+    path_docx = tmp_path / 'styles.docx'
+    _build_docx(str(path_docx))
+
+    converter = Docx2MdConverter(str(path_docx), str(tmp_path))
+    doc = Document(str(path_docx))
+    md_lines = []
+    converter._process_block(doc.paragraphs[0]._p, doc, md_lines)
+
+    assert md_lines == ['ChapterTitle', '']